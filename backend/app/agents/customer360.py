@@ -1,20 +1,194 @@
-from ..storage import SessionLocal, Customer as DBCustomer
+import threading
+import time
+from typing import AsyncIterable, Iterable
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from ..cache import ReadThroughCache, load_backend
+from ..config import settings
+from ..models import CustomerPayload
+from ..storage import AsyncSessionLocal, SessionLocal, Customer as DBCustomer
+
+_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+_COLUMNS = (DBCustomer.customer_id, DBCustomer.name, DBCustomer.email, DBCustomer.phone)
+
+
+_profile_cache: ReadThroughCache | None = None
+_profile_cache_lock = threading.Lock()
+
+
+def get_profile_cache() -> ReadThroughCache | None:
+    """Process-wide profile cache shared by the sync and async agents."""
+    global _profile_cache
+    if not settings.customer_cache_enabled:
+        return None
+    if _profile_cache is None:
+        with _profile_cache_lock:
+            if _profile_cache is None:
+                _profile_cache = ReadThroughCache(
+                    "customer",
+                    settings.customer_cache_max_entries,
+                    settings.customer_cache_ttl,
+                    load_backend(settings.customer_cache_backend),
+                )
+    return _profile_cache
+
+
+def _cache_stored(stored: dict):
+    cache = get_profile_cache()
+    if cache is not None:
+        cache.store(stored["customer_id"], dict(stored))
+
+
+def _invalidate(rows: list[dict]):
+    cache = get_profile_cache()
+    if cache is not None:
+        for row in rows:
+            cache.invalidate(row["customer_id"])
+
+
+def _to_dict(db) -> dict:
+    return {"customer_id": db.customer_id, "name": db.name, "email": db.email, "phone": db.phone}
+
+
+def _upsert_stmt(dialect: str):
+    # INSERT ... ON CONFLICT (customer_id) DO UPDATE: one atomic statement, so
+    # concurrent writers to the same customer_id cannot race.
+    stmt = _INSERTS[dialect](DBCustomer)
+    return stmt.on_conflict_do_update(
+        index_elements=[DBCustomer.customer_id],
+        set_={"name": stmt.excluded.name, "email": stmt.excluded.email, "phone": stmt.excluded.phone},
+    )
+
+
+def _dedupe(rows: list[dict]) -> list[dict]:
+    # Postgres rejects a multi-row ON CONFLICT touching the same key twice; last write wins.
+    return list({r["customer_id"]: r for r in rows}.values())
+
+
+def _row(customer_id: str, name: str, email: str, phone: str | None) -> dict:
+    return {"customer_id": customer_id, "name": name, "email": email, "phone": phone}
+
+
+class ImportSummary:
+    MAX_ERRORS = 100
+
+    def __init__(self):
+        self.processed = self.upserted = self.failed = 0
+        self.errors: list[dict] = []
+        self.pending: list[dict] = []
+
+    def add(self, line: int, record: dict | Exception):
+        self.processed += 1
+        if isinstance(record, Exception):
+            self._fail(line, str(record))
+            return
+        try:
+            self.pending.append(CustomerPayload(**record).model_dump())
+        except ValidationError as exc:
+            error = exc.errors()[0]
+            self._fail(line, f"{'.'.join(map(str, error['loc']))}: {error['msg']}")
+
+    def _fail(self, line: int, message: str):
+        self.failed += 1
+        if len(self.errors) < self.MAX_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+    def take(self) -> list[dict]:
+        chunk, self.pending = self.pending, []
+        return chunk
+
+    def as_dict(self) -> dict:
+        return {"processed": self.processed, "upserted": self.upserted, "failed": self.failed, "errors": self.errors}
+
 
 class Customer360Agent:
-    def upsert(self, customer_id: str, name: str, email: str, phone: str | None = None):
+    def upsert(self, customer_id: str, name: str, email: str, phone: str | None = None) -> dict:
         with SessionLocal() as s:
-            db = s.query(DBCustomer).filter_by(customer_id=customer_id).one_or_none()
-            if not db:
-                db = DBCustomer(customer_id=customer_id, name=name, email=email, phone=phone)
-                s.add(db)
-            else:
-                db.name, db.email, db.phone = name, email, phone
+            stmt = _upsert_stmt(s.bind.dialect.name).values(_row(customer_id, name, email, phone))
+            stored = _to_dict(s.execute(stmt.returning(*_COLUMNS)).one())
             s.commit()
-        return True
+        _cache_stored(stored)
+        return stored
+
+    def upsert_many(self, rows: list[dict]) -> int:
+        if not rows:
+            return 0
+        rows = _dedupe(rows)
+        with SessionLocal() as s:
+            s.execute(_upsert_stmt(s.bind.dialect.name), rows)
+            s.commit()
+        _invalidate(rows)
+        return len(rows)
+
+    def import_records(self, records: Iterable[tuple[int, dict | Exception]], chunk_size: int = 1000) -> dict:
+        summary = ImportSummary()
+        for line, record in records:
+            summary.add(line, record)
+            if len(summary.pending) >= chunk_size:
+                summary.upserted += self.upsert_many(summary.take())
+        summary.upserted += self.upsert_many(summary.take())
+        return summary.as_dict()
 
     def get(self, customer_id: str):
+        cache = get_profile_cache()
+        if cache is not None:
+            hit = cache.lookup(customer_id)
+            if hit is not None:
+                return dict(hit)
+        started = time.perf_counter()
         with SessionLocal() as s:
             db = s.query(DBCustomer).filter_by(customer_id=customer_id).one_or_none()
-            if not db:
-                return None
-            return {"customer_id": db.customer_id, "name": db.name, "email": db.email, "phone": db.phone}
+            record = _to_dict(db) if db else None
+        if cache is not None:
+            cache.record_load(customer_id, record and dict(record), started)
+        return record
+
+
+class AsyncCustomer360Agent:
+    """Customer360Agent on AsyncSession, for routes served on the event loop."""
+
+    async def upsert(self, customer_id: str, name: str, email: str, phone: str | None = None) -> dict:
+        async with AsyncSessionLocal() as s:
+            stmt = _upsert_stmt(s.bind.dialect.name).values(_row(customer_id, name, email, phone))
+            stored = _to_dict((await s.execute(stmt.returning(*_COLUMNS))).one())
+            await s.commit()
+        _cache_stored(stored)
+        return stored
+
+    async def upsert_many(self, rows: list[dict]) -> int:
+        if not rows:
+            return 0
+        rows = _dedupe(rows)
+        async with AsyncSessionLocal() as s:
+            await s.execute(_upsert_stmt(s.bind.dialect.name), rows)
+            await s.commit()
+        _invalidate(rows)
+        return len(rows)
+
+    async def import_records(
+        self, records: AsyncIterable[tuple[int, dict | Exception]], chunk_size: int = 1000
+    ) -> dict:
+        summary = ImportSummary()
+        async for line, record in records:
+            summary.add(line, record)
+            if len(summary.pending) >= chunk_size:
+                summary.upserted += await self.upsert_many(summary.take())
+        summary.upserted += await self.upsert_many(summary.take())
+        return summary.as_dict()
+
+    async def get(self, customer_id: str):
+        cache = get_profile_cache()
+        if cache is not None:
+            hit = cache.lookup(customer_id)
+            if hit is not None:
+                return dict(hit)
+        started = time.perf_counter()
+        async with AsyncSessionLocal() as s:
+            db = (await s.execute(select(DBCustomer).filter_by(customer_id=customer_id))).scalar_one_or_none()
+            record = _to_dict(db) if db else None
+        if cache is not None:
+            cache.record_load(customer_id, record and dict(record), started)
+        return record
@@ -1,13 +1,24 @@
 from sklearn.ensemble import IsolationForest
 import numpy as np
 
+from ..model_registry import load_or_fit
+
 class FraudAgent:
-    def __init__(self):
+    registry_name = "fraud"
+
+    def __init__(self, model=None, version: str = "local"):
+        if model is None:
+            model, version = load_or_fit(self.registry_name, self.fit)
+        self.model = model
+        self.version = version
+
+    @staticmethod
+    def fit():
         rng = np.random.default_rng(0)
         # synthetic non-fraud claim amounts ~ Normal(3000, 1000)
         normal_claims = rng.normal(3000, 1000, size=1000).clip(200, 20000).reshape(-1,1)
-        self.model = IsolationForest(contamination=0.03, random_state=0)
-        self.model.fit(normal_claims)
+        model = IsolationForest(contamination=0.03, random_state=0)
+        return model.fit(normal_claims)
 
     def score_claim(self, amount: float) -> float:
         x = np.array([[amount]], dtype=float)
@@ -16,3 +27,12 @@ class FraudAgent:
         # map roughly to [0,1]
         risk = float(round((0.5 - score), 4))
         return max(0.0, min(1.0, risk))
+
+    def score_claims(self, amounts) -> list[float]:
+        x = np.asarray(amounts, dtype=float).reshape(-1, 1)
+        if not len(x):
+            return []
+        score = self.model.decision_function(x)
+        # np.round is what round() does on a NumPy scalar, so this matches score_claim
+        risk = np.round(0.5 - score, 4)
+        return np.clip(risk, 0.0, 1.0).tolist()
@@ -6,3 +6,8 @@ class LearningFeedbackAgent:
 
     def record(self, kind: str, inputs: dict, outputs: dict):
         self.obs.log("feedback", f"{kind}_record", {"inputs": inputs, "outputs": outputs})
+
+    def record_many(self, kind: str, inputs: list[dict], outputs: list[dict]):
+        self.obs.log_many(
+            [("feedback", f"{kind}_record", {"inputs": i, "outputs": o}) for i, o in zip(inputs, outputs)]
+        )
@@ -1,16 +1,242 @@
-from ..storage import SessionLocal, Log
+import asyncio
+import atexit
+import json
+import logging
+import queue
+import threading
 from datetime import datetime
+from typing import AsyncIterator
+
+from sqlalchemy import insert, select
+
+from ..config import settings
+from ..storage import AsyncSessionLocal, SessionLocal, Log, engine
+
+logger = logging.getLogger(__name__)
+
+
+class LogWriter:
+    """Bounded write-behind buffer for audit log rows.
+
+    Request threads enqueue rows; a daemon thread bulk-inserts them with a single
+    ``executemany`` per flush, triggered when ``batch_size`` rows are waiting or
+    every ``flush_interval`` seconds. When the buffer is full producers block for
+    up to ``put_timeout`` seconds (backpressure) before the row is dropped.
+    """
+
+    def __init__(self, max_size: int, batch_size: int, flush_interval: float, put_timeout: float):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
+        self._retry: list[dict] = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self.enqueued = self.written = self.dropped = self.flushes = self.errors = 0
+
+    def submit(self, row: dict, block: bool = True) -> bool:
+        self._ensure_started()
+        try:
+            self._queue.put(row, block=block, timeout=self.put_timeout)
+        except queue.Full:
+            with self._stats_lock:
+                self.dropped += 1
+            return False
+        with self._stats_lock:
+            self.enqueued += 1
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+        return True
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            rows, self._retry = self._retry, []
+            while True:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not rows:
+                return 0
+            try:
+                with engine.begin() as conn:
+                    conn.execute(insert(Log), rows)
+            except Exception:
+                logger.exception("Failed to flush %d log rows; retrying on next flush", len(rows))
+                self._retry = rows
+                with self._stats_lock:
+                    self.errors += 1
+                return 0
+            with self._stats_lock:
+                self.written += len(rows)
+                self.flushes += 1
+            return len(rows)
+
+    def close(self):
+        thread = self._thread
+        if thread is not None:
+            self._stop.set()
+            self._wake.set()
+            thread.join()
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "queued": self._queue.qsize() + len(self._retry),
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "flushes": self.flushes,
+                "errors": self.errors,
+            }
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._flush_lock:
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+_writer: LogWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer() -> LogWriter:
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = LogWriter(
+                    max_size=settings.log_buffer_size,
+                    batch_size=settings.log_flush_batch,
+                    flush_interval=settings.log_flush_interval,
+                    put_timeout=settings.log_put_timeout,
+                )
+                atexit.register(_writer.close)
+    return _writer
+
+
+LOG_COLUMNS = (Log.id, Log.ts, Log.actor, Log.action, Log.payload)
+
+
+def _log_to_dict(r) -> dict:
+    return {"id": r.id, "ts": r.ts.isoformat(), "actor": r.actor, "action": r.action, "payload": r.payload}
+
+
+def _log_query(
+    actor: str | None = None,
+    action: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: int | None = None,
+    ascending: bool = False,
+):
+    # Plain column rows (no ORM identity map); filters line up with ix_logs_actor_action_ts.
+    stmt = select(*LOG_COLUMNS)
+    if actor is not None:
+        stmt = stmt.where(Log.actor == actor)
+    if action is not None:
+        stmt = stmt.where(Log.action == action)
+    if since is not None:
+        stmt = stmt.where(Log.ts >= since)
+    if until is not None:
+        stmt = stmt.where(Log.ts < until)
+    if cursor is not None:
+        # Keyset pagination: continue strictly past the last id already returned.
+        stmt = stmt.where(Log.id > cursor if ascending else Log.id < cursor)
+    return stmt.order_by(Log.id.asc() if ascending else Log.id.desc())
+
 
 class ObservabilityAgent:
+    def __init__(self):
+        self.writer = get_log_writer() if settings.log_write_behind else None
+
     def log(self, actor: str, action: str, payload: dict):
+        if self.writer is not None:
+            self.writer.submit({"ts": datetime.utcnow(), "actor": actor, "action": action, "payload": payload})
+            return
         with SessionLocal() as s:
             s.add(Log(actor=actor, action=action, payload=payload))
             s.commit()
 
-    def list(self, limit: int = 50):
+    def log_many(self, records: list[tuple[str, str, dict]]):
+        if not records:
+            return
+        if self.writer is not None:
+            ts = datetime.utcnow()
+            for actor, action, payload in records:
+                self.writer.submit({"ts": ts, "actor": actor, "action": action, "payload": payload})
+            return
         with SessionLocal() as s:
-            rows = s.query(Log).order_by(Log.id.desc()).limit(limit).all()
-            return [
-                {"id": r.id, "ts": r.ts.isoformat(), "actor": r.actor, "action": r.action, "payload": r.payload}
-                for r in rows
-            ]
+            s.add_all([Log(actor=actor, action=action, payload=payload) for actor, action, payload in records])
+            s.commit()
+
+    def flush(self):
+        if self.writer is not None:
+            self.writer.flush()
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+    def stats(self) -> dict:
+        return self.writer.stats() if self.writer is not None else {}
+
+    def list(self, limit: int = 50, **filters):
+        # Read-your-writes: drain anything still buffered before querying.
+        self.flush()
+        with SessionLocal() as s:
+            rows = s.execute(_log_query(**filters).limit(limit)).all()
+            return [_log_to_dict(r) for r in rows]
+
+
+class AsyncObservabilityAgent:
+    """ObservabilityAgent for async routes: never blocks the event loop on I/O.
+
+    Buffered rows go to the same process-wide LogWriter without waiting for
+    space (a full buffer drops and counts instead of stalling the loop).
+    """
+
+    def __init__(self):
+        self.writer = get_log_writer() if settings.log_write_behind else None
+
+    async def log(self, actor: str, action: str, payload: dict):
+        if self.writer is not None:
+            row = {"ts": datetime.utcnow(), "actor": actor, "action": action, "payload": payload}
+            self.writer.submit(row, block=False)
+            return
+        async with AsyncSessionLocal() as s:
+            s.add(Log(actor=actor, action=action, payload=payload))
+            await s.commit()
+
+    async def list(self, limit: int = 50, **filters):
+        """Newest first. Pass the last returned ``id`` as ``cursor`` for the next page."""
+        if self.writer is not None:
+            await asyncio.to_thread(self.writer.flush)
+        async with AsyncSessionLocal() as s:
+            rows = (await s.execute(_log_query(**filters).limit(limit))).all()
+            return [_log_to_dict(r) for r in rows]
+
+    async def export(self, batch_size: int = 1000, **filters) -> AsyncIterator[str]:
+        """Yield NDJSON chunks, oldest first, from a server-side cursor."""
+        if self.writer is not None:
+            await asyncio.to_thread(self.writer.flush)
+        stmt = _log_query(ascending=True, **filters).execution_options(yield_per=batch_size)
+        async with AsyncSessionLocal() as s:
+            result = await s.stream(stmt)
+            async for rows in result.partitions():
+                yield "".join(json.dumps(_log_to_dict(r), default=str) + "\n" for r in rows)
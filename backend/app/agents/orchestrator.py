@@ -1,3 +1,5 @@
+from ..cache import TTLCache
+from ..config import settings
 from .risk_model import RiskModel
 from .pricing import PricingAgent
 from .underwriting import UnderwritingAgent
@@ -17,8 +19,41 @@ class DecisionOrchestrator:
         self.obs = obs
         self.feedback = LearningFeedbackAgent()
         self.c360 = Customer360Agent()
+        self.cache = (
+            TTLCache(settings.quote_cache_max_entries, settings.quote_cache_ttl)
+            if settings.quote_cache_enabled
+            else None
+        )
+        self._cache_version = self.risk.version
+
+    def _cache_key(self, payload: dict) -> tuple:
+        if self.risk.version != self._cache_version:
+            # A new model was loaded: every cached decision is stale.
+            self.cache.clear()
+            self._cache_version = self.risk.version
+        return (
+            self.risk.version,
+            str(payload["customer_id"]),
+            int(payload["age"]),
+            float(payload["vehicle_value"]),
+            int(payload["prior_claims"]),
+            int(payload["credit_score"]),
+            payload.get("gender"),
+        )
 
     def quote(self, payload: dict):
+        key = None
+        if self.cache is not None:
+            key = self._cache_key(payload)
+            hit = self.cache.get(key)
+            if hit is not None:
+                # Keep the audit trail without re-logging the full payload.
+                self.obs.log(
+                    "orchestrator",
+                    "quote_cache_hit",
+                    {"customer_id": key[1], "model_version": key[0], "decision": hit["decision"]},
+                )
+                return {**hit, "reasons": list(hit["reasons"])}
         self.gov.validate_quote(payload)
         self.obs.log("orchestrator", "quote_received", payload)
         prob = self.risk.predict_proba(payload)
@@ -37,8 +72,32 @@ class DecisionOrchestrator:
         }
         self.obs.log("orchestrator", "quote_decided", out)
         self.feedback.record("quote", payload, out)
+        if key is not None:
+            self.cache.set(key, {**out, "reasons": list(reasons)})
         return out
 
+    def quote_many(self, payloads: list[dict]):
+        for payload in payloads:
+            self.gov.validate_quote(payload)
+        self.obs.log_many([("orchestrator", "quote_received", p) for p in payloads])
+        probs = self.risk.predict_proba_many(payloads)
+        prices = self.pricing.quote_many(probs, payloads)
+        decisions = self.uw.pre_decision_many(probs, payloads)
+        outs = []
+        for payload, prob, price, (decision, reasons) in zip(payloads, probs, prices, decisions):
+            self.compliance.check_pep(payload.get("customer_id", ""))
+            reasons += self.compliance.basic_fairness_check(prob, payload)
+            outs.append({
+                "probability_of_loss": prob,
+                "base_premium": price["base_premium"],
+                "final_premium": price["final_premium"],
+                "decision": decision,
+                "reasons": reasons,
+            })
+        self.obs.log_many([("orchestrator", "quote_decided", o) for o in outs])
+        self.feedback.record_many("quote", payloads, outs)
+        return outs
+
     def underwrite(self, payload: dict):
         self.gov.validate_underwrite(payload)
         prob = self.risk.predict_proba(payload)
@@ -1,3 +1,5 @@
+import numpy as np
+
 class PricingAgent:
     def quote(self, prob: float, payload: dict) -> dict:
         base_rate = 300.0
@@ -7,3 +9,20 @@ class PricingAgent:
         base_premium = base_rate * value_factor + prior_claims_fee
         final_premium = round(base_premium * risk_multiplier, 2)
         return {"base_premium": round(base_premium, 2), "final_premium": final_premium}
+
+    def quote_many(self, probs: list[float], payloads: list[dict]) -> list[dict]:
+        prob = np.asarray(probs, dtype=float)
+        vehicle_value = np.array([p["vehicle_value"] for p in payloads], dtype=float)
+        prior_claims = np.array([p["prior_claims"] for p in payloads], dtype=float)
+        base_rate = 300.0
+        risk_multiplier = 1 + 2.5 * prob
+        value_factor = np.clip(vehicle_value / 20000.0, 0.5, 2.0)
+        prior_claims_fee = 50.0 * prior_claims
+        base_premium = base_rate * value_factor + prior_claims_fee
+        final_premium = base_premium * risk_multiplier
+        # Python's round() is correctly rounded; np.round is not, so round per item
+        # to match quote() exactly.
+        return [
+            {"base_premium": round(b, 2), "final_premium": round(f, 2)}
+            for b, f in zip(base_premium.tolist(), final_premium.tolist())
+        ]
@@ -1,11 +1,73 @@
 from sklearn.pipeline import make_pipeline
 from sklearn.preprocessing import StandardScaler
 from sklearn.linear_model import LogisticRegression
+import math
+
 import numpy as np
 
+from ..config import settings
+from ..model_registry import load_or_fit
+
+FEATURES = ("age", "vehicle_value", "prior_claims", "credit_score")
+
+
+def _on_rounding_tie(p: float) -> bool:
+    scaled = p * 1e4
+    return abs(scaled - math.floor(scaled) - 0.5) < 1e-6
+
+
+class CompiledRiskScorer:
+    """StandardScaler + LogisticRegression flattened into plain floats.
+
+    Scoring one row is four multiply-adds and a sigmoid, which skips the
+    per-call input validation sklearn performs and is much faster for the
+    single-quote path. Rows landing on a rounding boundary defer to the
+    pipeline so results match it exactly.
+    """
+
+    __slots__ = ("pipe", "mean", "scale", "coef", "intercept")
+
+    def __init__(self, pipe):
+        scaler, clf = pipe[0], pipe[-1]
+        self.pipe = pipe
+        self.mean = tuple(scaler.mean_.tolist())
+        self.scale = tuple(scaler.scale_.tolist())
+        self.coef = tuple(clf.coef_[0].tolist())
+        self.intercept = float(clf.intercept_[0])
+
+    def raw_proba(self, payload: dict) -> float:
+        m0, m1, m2, m3 = self.mean
+        s0, s1, s2, s3 = self.scale
+        c0, c1, c2, c3 = self.coef
+        z = (
+            (payload["age"] - m0) / s0 * c0
+            + (payload["vehicle_value"] - m1) / s1 * c1
+            + (payload["prior_claims"] - m2) / s2 * c2
+            + (payload["credit_score"] - m3) / s3 * c3
+            + self.intercept
+        )
+        return 1.0 / (1.0 + math.exp(-z)) if z > -709 else 0.0
+
+    def predict_proba(self, payload: dict) -> float:
+        p = self.raw_proba(payload)
+        if _on_rounding_tie(p):
+            X = np.array([[payload[f] for f in FEATURES]], dtype=float)
+            p = self.pipe.predict_proba(X)[0, 1].item()
+        return float(round(p, 4))
+
 class RiskModel:
-    def __init__(self):
-        # Train a tiny synthetic model on init
+    registry_name = "risk_model"
+
+    def __init__(self, pipe=None, version: str = "local"):
+        if pipe is None:
+            # Load the published artifact, or train a tiny synthetic model
+            pipe, version = load_or_fit(self.registry_name, self.fit)
+        self.pipe = pipe
+        self.version = version
+        self.compiled = CompiledRiskScorer(pipe) if settings.risk_scoring_mode == "compiled" else None
+
+    @staticmethod
+    def fit():
         rng = np.random.default_rng(42)
         n = 500
         age = rng.integers(18, 80, size=n)
@@ -22,10 +84,12 @@ class RiskModel:
         y = (logits + rng.normal(0, 0.5, size=n) > 0.5).astype(int)
 
         X = np.vstack([age, vehicle_value, prior_claims, credit_score]).T
-        self.pipe = make_pipeline(StandardScaler(), LogisticRegression(max_iter=500))
-        self.pipe.fit(X, y)
+        pipe = make_pipeline(StandardScaler(), LogisticRegression(max_iter=500))
+        return pipe.fit(X, y)
 
     def predict_proba(self, payload: dict) -> float:
+        if self.compiled is not None:
+            return self.compiled.predict_proba(payload)
         age = payload["age"]
         vehicle_value = payload["vehicle_value"]
         prior_claims = payload["prior_claims"]
@@ -33,3 +97,20 @@ class RiskModel:
         X = np.array([[age, vehicle_value, prior_claims, credit_score]], dtype=float)
         p = self.pipe.predict_proba(X)[0, 1].item()
         return float(round(p, 4))
+
+    def predict_proba_many(self, payloads: list[dict]) -> list[float]:
+        X = np.array(
+            [[p["age"], p["vehicle_value"], p["prior_claims"], p["credit_score"]] for p in payloads],
+            dtype=float,
+        ).reshape(-1, 4)
+        if not len(X):
+            return []
+        raw = self.pipe.predict_proba(X)[:, 1]
+        probs = [round(p, 4) for p in raw.tolist()]
+        # BLAS may use a different kernel for an Nx4 matrix than for a single row,
+        # so raw scores can differ by a few ulps. Re-score the rare rows sitting on
+        # a rounding boundary so results stay identical to predict_proba.
+        for i, p in enumerate(raw.tolist()):
+            if _on_rounding_tie(p):
+                probs[i] = self.predict_proba(payloads[i])
+        return probs
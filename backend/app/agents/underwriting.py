@@ -1,3 +1,5 @@
+import numpy as np
+
 class UnderwritingAgent:
     def pre_decision(self, prob: float, price: dict, payload: dict):
         reasons = []
@@ -13,6 +15,26 @@ class UnderwritingAgent:
             reasons.append("Low credit score")
         return decision, reasons
 
+    def pre_decision_many(self, probs: list[float], payloads: list[dict]):
+        prob = np.asarray(probs, dtype=float)
+        credit_score = np.array([p.get("credit_score", 650) for p in payloads], dtype=float)
+        high = prob > 0.6
+        borderline = ~high & (prob > 0.4)
+        low_credit = credit_score < 550
+        decisions = np.where(high, "reject", np.where(borderline, "refer", "auto_approve"))
+        decisions = np.where(low_credit, "refer", decisions)
+        out = []
+        for i, p in enumerate(probs):
+            reasons = []
+            if high[i]:
+                reasons.append(f"High risk score {p}")
+            elif borderline[i]:
+                reasons.append(f"Borderline risk score {p}")
+            if low_credit[i]:
+                reasons.append("Low credit score")
+            out.append((str(decisions[i]), reasons))
+        return out
+
     def final_decision(self, prob: float, price: dict, payload: dict):
         decision, reasons = self.pre_decision(prob, price, payload)
         # add a simple capacity rule
@@ -0,0 +1,188 @@
+import importlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Protocol
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache with an optional per-entry time-to-live."""
+
+    def __init__(self, max_entries: int, ttl: float | None = None, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at < self._clock():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: object):
+        expires_at = self._clock() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class CacheBackend(Protocol):
+    """Shared cache (Redis, Memcached, ...) consulted after the in-process tier."""
+
+    def get(self, key: str) -> object | None: ...
+
+    def set(self, key: str, value: object, ttl: float | None = None) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class MemoryCacheBackend:
+    """Dict-backed CacheBackend, standing in for a shared cache in tests and local runs."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._data: dict[str, tuple[float, object]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> object | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] < self._clock():
+                del self._data[key]
+                return None
+            return entry[1]
+
+    def set(self, key: str, value: object, ttl: float | None = None):
+        expires_at = self._clock() + ttl if ttl is not None else float("inf")
+        with self._lock:
+            self._data[key] = (expires_at, value)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+
+class ReadThroughCache:
+    """Two-tier read-through cache: a local TTLCache, then an optional shared backend.
+
+    Callers load on a miss and write through on updates, so the tiers stay
+    consistent with the database for writes made by this process. Counts hits
+    per tier and the time spent serving hits versus loading misses.
+    """
+
+    def __init__(self, namespace: str, max_entries: int, ttl: float | None, backend: CacheBackend | None = None):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.local = TTLCache(max_entries, ttl)
+        self.backend = backend
+        self._lock = threading.Lock()
+        self.local_hits = self.shared_hits = self.misses = 0
+        self.hit_seconds = self.load_seconds = 0.0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def lookup(self, key: str):
+        start = time.perf_counter()
+        value = self.local.get(key)
+        if value is not None:
+            self._record("local_hits", "hit_seconds", start)
+            return value
+        if self.backend is not None:
+            value = self.backend.get(self._key(key))
+            if value is not None:
+                self.local.set(key, value)
+                self._record("shared_hits", "hit_seconds", start)
+                return value
+        return None
+
+    def record_load(self, key: str, value, started: float):
+        """Store a value loaded after a miss; ``started`` is its perf_counter() start."""
+        if value is not None:
+            self.store(key, value)
+        self._record("misses", "load_seconds", started)
+
+    def store(self, key: str, value: object):
+        self.local.set(key, value)
+        if self.backend is not None:
+            self.backend.set(self._key(key), value, self.ttl)
+
+    def invalidate(self, key: str):
+        self.local.delete(key)
+        if self.backend is not None:
+            self.backend.delete(self._key(key))
+
+    def _record(self, counter: str, timer: str, started: float):
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+            setattr(self, timer, getattr(self, timer) + elapsed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.local_hits + self.shared_hits
+            lookups = hits + self.misses
+            return {
+                "entries": len(self.local),
+                "local_hits": self.local_hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+                "avg_hit_ms": round(self.hit_seconds / hits * 1000, 4) if hits else 0.0,
+                "avg_load_ms": round(self.load_seconds / self.misses * 1000, 4) if self.misses else 0.0,
+                "evictions": self.local.evictions,
+            }
+
+
+def load_backend(spec: str | None) -> CacheBackend | None:
+    """Build a backend from ``"memory"`` or a ``"package.module:factory"`` import path."""
+    if not spec:
+        return None
+    if spec == "memory":
+        return MemoryCacheBackend()
+    module_name, _, attr = spec.partition(":")
+    factory = getattr(importlib.import_module(module_name), attr)
+    return factory()
@@ -0,0 +1,104 @@
+"""Operational commands: ``python -m app.cli <group> <command>``."""
+
+import argparse
+import json
+import sys
+
+from .config import settings
+from .model_registry import ModelRegistry, get_registry
+
+
+def _model_classes() -> dict:
+    from .agents.fraud import FraudAgent
+    from .agents.risk_model import RiskModel
+
+    return {cls.registry_name: cls for cls in (RiskModel, FraudAgent)}
+
+
+def _registry(args) -> ModelRegistry:
+    registry = ModelRegistry(args.registry) if args.registry else get_registry()
+    if registry is None:
+        sys.exit("No registry configured: pass --registry or set REGISTRY_DIR")
+    return registry
+
+
+def models_publish(args):
+    registry = _registry(args)
+    classes = _model_classes()
+    names = list(classes) if args.name == "all" else [args.name]
+    for name in names:
+        manifest = registry.publish(name, classes[name].fit())
+        print(json.dumps(manifest))
+
+
+def models_list(args):
+    registry = _registry(args)
+    names = [args.name] if args.name else list(_model_classes())
+    for name in names:
+        current = registry.current(name)
+        for manifest in registry.versions(name):
+            print(json.dumps({**manifest, "current": manifest["version"] == current}))
+
+
+def customers_import(args):
+    from .agents.customer360 import Customer360Agent
+    from .ingest import format_for, iter_records
+    from .storage import init_db
+
+    fmt = args.format or format_for(None, args.path)
+    init_db()
+    with open(args.path, encoding="utf-8", newline="") as f:
+        summary = Customer360Agent().import_records(iter_records(f, fmt), args.chunk_size)
+    print(json.dumps(summary))
+
+
+def logs_compact(args):
+    from .log_archive import LogArchive
+
+    archive = LogArchive(args.archive_dir, args.retention_days)
+    for summary in archive.compact():
+        print(json.dumps(summary))
+    for day in archive.prune():
+        print(json.dumps({"pruned": day}))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    groups = parser.add_subparsers(dest="group", required=True)
+
+    models = groups.add_parser("models", help="Train, publish and inspect model artifacts")
+    models_cmds = models.add_subparsers(dest="command", required=True)
+    publish = models_cmds.add_parser("publish", help="Train a model and publish it as a new version")
+    publish.add_argument("name", choices=["all", *_model_classes()])
+    publish.add_argument("--registry", help="Registry directory (defaults to REGISTRY_DIR)")
+    publish.set_defaults(func=models_publish)
+    listing = models_cmds.add_parser("list", help="List published versions")
+    listing.add_argument("name", nargs="?")
+    listing.add_argument("--registry", help="Registry directory (defaults to REGISTRY_DIR)")
+    listing.set_defaults(func=models_list)
+
+    customers = groups.add_parser("customers", help="Customer 360 maintenance")
+    customers_cmds = customers.add_subparsers(dest="command", required=True)
+    importer = customers_cmds.add_parser("import", help="Bulk upsert customers from an NDJSON or CSV file")
+    importer.add_argument("path")
+    importer.add_argument("--format", choices=["ndjson", "csv"], help="Defaults to the file extension")
+    importer.add_argument("--chunk-size", type=int, default=settings.import_chunk_size)
+    importer.set_defaults(func=customers_import)
+
+    logs = groups.add_parser("logs", help="Audit log maintenance")
+    logs_cmds = logs.add_subparsers(dest="command", required=True)
+    compact = logs_cmds.add_parser("compact", help="Archive closed days to Parquet and apply retention")
+    compact.add_argument("--archive-dir", default=settings.log_archive_dir)
+    compact.add_argument("--retention-days", type=int, default=settings.log_retention_days)
+    compact.set_defaults(func=logs_compact)
+
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
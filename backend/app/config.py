@@ -1,8 +1,41 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     openai_api_key: str | None = None
     db_url: str = "sqlite:///insuretech.sqlite3"
+    # Defaults to db_url with its async driver (aiosqlite, asyncpg, aiomysql).
+    async_db_url: str | None = None
     env: str = "local"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    sqlite_wal: bool = True
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    sqlite_busy_timeout: float = 5.0
+    registry_dir: str | None = None
+    risk_scoring_mode: Literal["pipeline", "compiled"] = "pipeline"
+    quote_cache_enabled: bool = False
+    quote_cache_ttl: float = 300.0
+    quote_cache_max_entries: int = 10000
+    customer_cache_enabled: bool = True
+    customer_cache_ttl: float = 60.0
+    customer_cache_max_entries: int = 10000
+    # "memory" or "package.module:factory" returning an app.cache.CacheBackend.
+    customer_cache_backend: str | None = None
+    import_chunk_size: int = 1000
+    fraud_stream_chunk_size: int = 10000
+    log_write_behind: bool = True
+    log_buffer_size: int = 10000
+    log_flush_batch: int = 500
+    log_flush_interval: float = 0.5
+    log_put_timeout: float = 0.05
+    log_archive_dir: str = "log_archive"
+    log_retention_days: int = 365
+    # Seconds between background compaction runs; 0 leaves it to the CLI.
+    log_compaction_interval: float = 0
 
 settings = Settings()
@@ -0,0 +1,137 @@
+"""Day-partitioned archive for the audit log.
+
+The ``logs`` table only holds the open partition: rows from the current UTC
+day, plus anything not compacted yet. ``compact()`` moves every closed day
+into ``<archive_dir>/day=YYYY-MM-DD/logs.parquet`` (zstd-compressed, columnar)
+and deletes those rows from the hot table. ``prune()`` drops partitions older
+than the retention window. ``query()`` reads across live and archived rows.
+"""
+
+import json
+import os
+import shutil
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import delete, func, select
+
+from .agents.observability import ObservabilityAgent, LOG_COLUMNS
+from .config import settings
+from .storage import Log, engine
+
+SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("ts", pa.timestamp("us")),
+        ("actor", pa.string()),
+        ("action", pa.string()),
+        ("payload", pa.string()),
+    ]
+)
+
+
+def _to_table(rows) -> pa.Table:
+    return pa.Table.from_pydict(
+        {
+            "id": [r.id for r in rows],
+            "ts": [r.ts for r in rows],
+            "actor": [r.actor for r in rows],
+            "action": [r.action for r in rows],
+            "payload": [json.dumps(r.payload, default=str) for r in rows],
+        },
+        schema=SCHEMA,
+    )
+
+
+def _day_bounds(day: date) -> tuple[datetime, datetime]:
+    start = datetime.combine(day, time.min)
+    return start, start + timedelta(days=1)
+
+
+class LogArchive:
+    def __init__(self, root: str | Path | None = None, retention_days: int | None = None, batch_size: int = 10000):
+        self.root = Path(root or settings.log_archive_dir)
+        self.retention_days = retention_days if retention_days is not None else settings.log_retention_days
+        self.batch_size = batch_size
+
+    def partition_path(self, day: date) -> Path:
+        return self.root / f"day={day.isoformat()}" / "logs.parquet"
+
+    def partitions(self) -> list[date]:
+        days = [date.fromisoformat(p.parent.name[4:]) for p in self.root.glob("day=*/logs.parquet")]
+        return sorted(days)
+
+    def compact(self, now: datetime | None = None) -> list[dict]:
+        """Archive every day before ``now``'s UTC day; returns one summary per day."""
+        ObservabilityAgent().flush()
+        cutoff, _ = _day_bounds((now or datetime.utcnow()).date())
+        summaries = []
+        while True:
+            with engine.connect() as conn:
+                oldest = conn.execute(select(func.min(Log.ts)).where(Log.ts < cutoff)).scalar()
+            if oldest is None:
+                return summaries
+            summaries.append(self._compact_day(oldest.date()))
+
+    def _compact_day(self, day: date) -> dict:
+        start, end = _day_bounds(day)
+        path = self.partition_path(day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".parquet.tmp")
+        archived, max_id = 0, None
+        with pq.ParquetWriter(tmp, SCHEMA, compression="zstd") as writer:
+            if path.exists():
+                # Late rows for an already compacted day: rewrite with both.
+                writer.write_table(pq.read_table(path, schema=SCHEMA))
+            stmt = select(*LOG_COLUMNS).where(Log.ts >= start, Log.ts < end).order_by(Log.id)
+            with engine.connect() as conn:
+                result = conn.execution_options(yield_per=self.batch_size).execute(stmt)
+                for rows in result.partitions():
+                    writer.write_table(_to_table(rows))
+                    archived += len(rows)
+                    max_id = rows[-1].id
+        os.replace(tmp, path)
+        if max_id is not None:
+            with engine.begin() as conn:
+                conn.execute(delete(Log).where(Log.ts >= start, Log.ts < end, Log.id <= max_id))
+        return {"day": day.isoformat(), "rows": archived, "path": str(path)}
+
+    def prune(self, now: datetime | None = None) -> list[str]:
+        """Delete archived partitions older than the retention window."""
+        oldest_kept = (now or datetime.utcnow()).date() - timedelta(days=self.retention_days)
+        dropped = []
+        for day in self.partitions():
+            if day < oldest_kept:
+                shutil.rmtree(self.partition_path(day).parent)
+                dropped.append(day.isoformat())
+        return dropped
+
+    def query(
+        self,
+        limit: int = 50,
+        actor: str | None = None,
+        action: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[dict]:
+        """Newest-first rows from the live table, then archived partitions."""
+        rows = ObservabilityAgent().list(limit=limit, actor=actor, action=action, since=since, until=until)
+        seen = {r["id"] for r in rows}
+        filters = [("actor", "=", actor)] if actor is not None else []
+        filters += [("action", "=", action)] if action is not None else []
+        filters += [("ts", ">=", since)] if since is not None else []
+        filters += [("ts", "<", until)] if until is not None else []
+        for day in reversed(self.partitions()):
+            if len(rows) >= limit:
+                break
+            start, end = _day_bounds(day)
+            if (since is not None and end <= since) or (until is not None and start >= until):
+                continue
+            table = pq.read_table(self.partition_path(day), schema=SCHEMA, filters=filters or None)
+            table = table.sort_by([("id", "descending")]).slice(0, limit - len(rows))
+            for r in table.to_pylist():
+                if r["id"] not in seen:
+                    rows.append({**r, "ts": r["ts"].isoformat(), "payload": json.loads(r["payload"])})
+        return rows[:limit]
@@ -1,35 +1,47 @@
-from contextlib import asynccontextmanager
+import asyncio
+import json
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime
 from pathlib import Path
-from typing import Callable, MutableMapping, TypeVar, cast
+from typing import AsyncIterator, Callable, MutableMapping, TypeVar, cast
 
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
+from pydantic import ValidationError
 
 from .models import (
     QuoteRequest,
     QuoteResponse,
+    QuoteBatchRequest,
+    QuoteBatchResponse,
     UnderwriteRequest,
     UnderwriteResponse,
     ClaimReport,
     ClaimResponse,
+    FraudBatchRequest,
+    FraudBatchResponse,
+    FraudClaim,
     ChatRequest,
     ChatResponse,
     CustomerPayload,
     CustomerResponse,
+    CustomerBulkResponse,
     MarketingRequest,
     MarketingResponse,
 )
 
 from .agents.chatbot import ChatbotAgent
 from .agents.claims import ClaimsAgent
-from .agents.customer360 import Customer360Agent
+from .agents.customer360 import AsyncCustomer360Agent, get_profile_cache
 from .agents.marketing import MarketingAgent
 from .agents.fraud import FraudAgent
 from .agents.external_data import ExternalDataAgent
-from .agents.observability import ObservabilityAgent
+from .agents.observability import AsyncObservabilityAgent, ObservabilityAgent
 from .agents.orchestrator import DecisionOrchestrator
-from .storage import init_db
+from .config import settings
+from .ingest import achunked, aiter_records, format_for
+from .storage import async_engine, init_db
 
 AgentT = TypeVar("AgentT", bound=object)
 
@@ -45,20 +57,45 @@ except FileNotFoundError:
 init_db()
 
 
+async def _compact_logs_periodically(interval: float):
+    from .log_archive import LogArchive
+
+    archive = LogArchive()
+    while True:
+        await asyncio.sleep(interval)
+        await asyncio.to_thread(archive.compact)
+        await asyncio.to_thread(archive.prune)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db()
     obs_agent = ObservabilityAgent()
     app.state.obs_agent = obs_agent
+    app.state.async_obs_agent = AsyncObservabilityAgent()
     app.state.orchestrator = DecisionOrchestrator(obs_agent)
     app.state.agent_cache = {}
+    if settings.registry_dir:
+        # Published artifacts load in milliseconds, so preload instead of
+        # paying for the first /fraud/score hit in every worker.
+        app.state.agent_cache["fraud"] = FraudAgent()
+    compaction = None
+    if settings.log_compaction_interval > 0:
+        compaction = asyncio.create_task(_compact_logs_periodically(settings.log_compaction_interval))
     try:
         yield
     finally:
+        if compaction is not None:
+            compaction.cancel()
+            with suppress(asyncio.CancelledError):
+                await compaction
         cache = getattr(app.state, "agent_cache", None)
         if isinstance(cache, MutableMapping):
             cache.clear()
+        obs_agent.close()
+        await async_engine.dispose()
         app.state.obs_agent = None
+        app.state.async_obs_agent = None
         app.state.orchestrator = None
 
 
@@ -88,6 +125,14 @@ def get_obs():
     return obs
 
 
+def get_async_obs():
+    obs = getattr(app.state, "async_obs_agent", None)
+    if obs is None:
+        obs = AsyncObservabilityAgent()
+        app.state.async_obs_agent = obs
+    return obs
+
+
 def get_orchestrator(obs=Depends(get_obs)):
     orchestrator = getattr(app.state, "orchestrator", None)
     if orchestrator is None:
@@ -102,7 +147,7 @@ def index():
 
 
 def get_customer360():
-    return Customer360Agent()
+    return AsyncCustomer360Agent()
 
 @app.get("/health")
 def health():
@@ -114,6 +159,18 @@ def quote(req: QuoteRequest, orch: DecisionOrchestrator = Depends(get_orchestrat
     return orch.quote(req.model_dump())
 
 
+@app.post("/quote/batch", response_model=QuoteBatchResponse)
+def quote_batch(req: QuoteBatchRequest, orch: DecisionOrchestrator = Depends(get_orchestrator)):
+    return {"results": orch.quote_many([q.model_dump() for q in req.quotes])}
+
+
+@app.get("/quote/cache/stats")
+def quote_cache_stats(orch: DecisionOrchestrator = Depends(get_orchestrator)):
+    if orch.cache is None:
+        return {"enabled": False}
+    return {"enabled": True, "model_version": orch.risk.version, **orch.cache.stats()}
+
+
 @app.post("/underwrite", response_model=UnderwriteResponse)
 def underwrite(req: UnderwriteRequest, orch: DecisionOrchestrator = Depends(get_orchestrator)):
     return orch.underwrite(req.model_dump())
@@ -139,9 +196,96 @@ def fraud_score(amount: float):
     return {"amount": amount, "fraud_risk": score}
 
 
+@app.post("/fraud/score/batch", response_model=FraudBatchResponse)
+def fraud_score_batch(req: FraudBatchRequest):
+    agent = _get_cached_agent("fraud", FraudAgent)
+    risks = agent.score_claims([c.amount for c in req.claims])
+    return {
+        "results": [
+            {"claim_id": c.claim_id, "amount": c.amount, "fraud_risk": r} for c, r in zip(req.claims, risks)
+        ]
+    }
+
+
+async def _score_ndjson_stream(request: Request) -> AsyncIterator[str]:
+    agent = _get_cached_agent("fraud", FraudAgent)
+    records = aiter_records(request.stream(), "ndjson")
+    async for batch in achunked(records, settings.fraud_stream_chunk_size):
+        valid, lines = [], [""] * len(batch)
+        for i, (line, record) in enumerate(batch):
+            if isinstance(record, Exception):
+                lines[i] = json.dumps({"line": line, "error": str(record)})
+                continue
+            try:
+                valid.append((i, FraudClaim(**record)))
+            except ValidationError as exc:
+                lines[i] = json.dumps({"line": line, "error": exc.errors()[0]["msg"]})
+        risks = await asyncio.to_thread(agent.score_claims, [c.amount for _, c in valid])
+        for (i, claim), risk in zip(valid, risks):
+            lines[i] = json.dumps({"claim_id": claim.claim_id, "amount": claim.amount, "fraud_risk": risk})
+        yield "\n".join(lines) + "\n"
+
+
+@app.post("/fraud/score/batch/stream")
+async def fraud_score_stream(request: Request):
+    """Score an NDJSON body of ``{"claim_id", "amount"}`` objects, streaming NDJSON back in order."""
+    return StreamingResponse(_score_ndjson_stream(request), media_type="application/x-ndjson")
+
+
+def log_filters(
+    actor: str | None = None,
+    action: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> dict:
+    return {"actor": actor, "action": action, "since": since, "until": until}
+
+
 @app.get("/logs")
-def logs(obs: ObservabilityAgent = Depends(get_obs), limit: int = 50):
-    return obs.list(limit=limit)
+async def logs(
+    response: Response,
+    obs: AsyncObservabilityAgent = Depends(get_async_obs),
+    filters: dict = Depends(log_filters),
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: int | None = None,
+):
+    rows = await obs.list(limit=limit, cursor=cursor, **filters)
+    if len(rows) == limit:
+        response.headers["X-Next-Cursor"] = str(rows[-1]["id"])
+    return rows
+
+
+@app.get("/logs/export")
+async def export_logs(
+    obs: AsyncObservabilityAgent = Depends(get_async_obs),
+    filters: dict = Depends(log_filters),
+):
+    return StreamingResponse(obs.export(**filters), media_type="application/x-ndjson")
+
+
+@app.get("/logs/history")
+async def log_history(filters: dict = Depends(log_filters), limit: int = Query(50, ge=1, le=1000)):
+    """Newest-first logs across the live table and archived day partitions."""
+    from .log_archive import LogArchive
+
+    return await asyncio.to_thread(LogArchive().query, limit=limit, **filters)
+
+
+@app.get("/logs/stats")
+def log_stats(obs: ObservabilityAgent = Depends(get_obs)):
+    return obs.stats()
+
+
+@app.get("/stats")
+def stats(obs: ObservabilityAgent = Depends(get_obs)):
+    orchestrator = getattr(app.state, "orchestrator", None)
+    quote_cache = orchestrator.cache if orchestrator is not None else None
+    customer_cache = get_profile_cache()
+    return {
+        "log_writer": obs.stats(),
+        "quote_cache": quote_cache.stats() if quote_cache is not None else None,
+        "customer_cache": customer_cache.stats() if customer_cache is not None else None,
+    }
 
 
 @app.get("/fx")
@@ -151,37 +295,50 @@ async def fx(base: str = "USD"):
 
 
 @app.post("/customers", response_model=CustomerResponse)
-def upsert_customer(
+async def upsert_customer(
     payload: CustomerPayload,
-    c360: Customer360Agent = Depends(get_customer360),
-    obs: ObservabilityAgent = Depends(get_obs),
+    c360: AsyncCustomer360Agent = Depends(get_customer360),
+    obs: AsyncObservabilityAgent = Depends(get_async_obs),
 ):
-    c360.upsert(payload.customer_id, payload.name, payload.email, payload.phone)
-    obs.log("customer360", "upsert", payload.model_dump())
-    stored = c360.get(payload.customer_id)
-    if not stored:
-        raise HTTPException(status_code=500, detail="Customer record not stored")
+    stored = await c360.upsert(payload.customer_id, payload.name, payload.email, payload.phone)
+    await obs.log("customer360", "upsert", payload.model_dump())
     return stored
 
 
+@app.post("/customers/bulk", response_model=CustomerBulkResponse)
+async def bulk_upsert_customers(
+    request: Request,
+    c360: AsyncCustomer360Agent = Depends(get_customer360),
+    obs: AsyncObservabilityAgent = Depends(get_async_obs),
+):
+    """Stream an NDJSON (application/x-ndjson) or CSV (text/csv) body of customers."""
+    try:
+        fmt = format_for(request.headers.get("content-type"))
+    except ValueError as exc:
+        raise HTTPException(status_code=415, detail=str(exc))
+    summary = await c360.import_records(aiter_records(request.stream(), fmt), settings.import_chunk_size)
+    await obs.log("customer360", "bulk_upsert", {k: v for k, v in summary.items() if k != "errors"})
+    return summary
+
+
 @app.get("/customers/{customer_id}", response_model=CustomerResponse)
-def get_customer(customer_id: str, c360: Customer360Agent = Depends(get_customer360)):
-    record = c360.get(customer_id)
+async def get_customer(customer_id: str, c360: AsyncCustomer360Agent = Depends(get_customer360)):
+    record = await c360.get(customer_id)
     if not record:
         raise HTTPException(status_code=404, detail="Customer not found")
     return record
 
 
 @app.post("/marketing/outreach", response_model=MarketingResponse)
-def marketing_outreach(
+async def marketing_outreach(
     payload: MarketingRequest,
-    c360: Customer360Agent = Depends(get_customer360),
-    obs: ObservabilityAgent = Depends(get_obs),
+    c360: AsyncCustomer360Agent = Depends(get_customer360),
+    obs: AsyncObservabilityAgent = Depends(get_async_obs),
 ):
-    customer = c360.get(payload.customer_id)
+    customer = await c360.get(payload.customer_id)
     name = customer["name"] if customer else payload.customer_id
     message = MarketingAgent().craft_outreach(name, payload.product)
-    obs.log(
+    await obs.log(
         "marketing",
         "outreach_generated",
         {"customer_id": payload.customer_id, "product": payload.product, "has_profile": bool(customer)},
@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import joblib
+
+from .config import settings
+
+ARTIFACT = "model.joblib"
+MANIFEST = "manifest.json"
+CURRENT = "CURRENT"
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ModelRegistry:
+    """Versioned on-disk store of fitted models.
+
+    Layout: ``<root>/<name>/<version>/{model.joblib,manifest.json}`` plus a
+    ``<root>/<name>/CURRENT`` pointer that is swapped atomically on publish.
+    Artifacts are written uncompressed so NumPy arrays can be memory-mapped and
+    shared through the page cache by every worker on the node.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def versions(self, name: str) -> list[dict]:
+        model_dir = self.root / name
+        if not model_dir.is_dir():
+            return []
+        manifests = [json.loads(p.read_text()) for p in model_dir.glob(f"v*/{MANIFEST}")]
+        return sorted(manifests, key=lambda m: int(m["version"][1:]))
+
+    def current(self, name: str) -> str | None:
+        pointer = self.root / name / CURRENT
+        return pointer.read_text().strip() if pointer.exists() else None
+
+    def publish(self, name: str, model: object) -> dict:
+        model_dir = self.root / name
+        model_dir.mkdir(parents=True, exist_ok=True)
+        existing = self.versions(name)
+        version = f"v{int(existing[-1]['version'][1:]) + 1 if existing else 1}"
+        version_dir = model_dir / version
+        version_dir.mkdir()
+        artifact = version_dir / ARTIFACT
+        joblib.dump(model, artifact)
+        manifest = {
+            "name": name,
+            "version": version,
+            "sha256": _sha256(artifact),
+            "created_at": datetime.utcnow().isoformat(),
+        }
+        (version_dir / MANIFEST).write_text(json.dumps(manifest, indent=2))
+        tmp = model_dir / f"{CURRENT}.tmp"
+        tmp.write_text(version)
+        os.replace(tmp, model_dir / CURRENT)
+        return manifest
+
+    def load(self, name: str, version: str | None = None, mmap: bool = True) -> tuple[object, dict]:
+        version = version or self.current(name)
+        if version is None:
+            raise LookupError(f"No published version of model '{name}'")
+        version_dir = self.root / name / version
+        manifest = json.loads((version_dir / MANIFEST).read_text())
+        artifact = version_dir / ARTIFACT
+        if _sha256(artifact) != manifest["sha256"]:
+            raise ValueError(f"Checksum mismatch for model '{name}' {version}")
+        model = joblib.load(artifact, mmap_mode="r" if mmap else None)
+        return model, manifest
+
+
+def get_registry() -> ModelRegistry | None:
+    if not settings.registry_dir:
+        return None
+    return ModelRegistry(settings.registry_dir)
+
+
+def load_or_fit(name: str, fit: Callable[[], object]) -> tuple[object, str]:
+    """Load the current published artifact, falling back to fitting in-process."""
+    registry = get_registry()
+    if registry is not None and registry.current(name) is not None:
+        model, manifest = registry.load(name)
+        return model, manifest["version"]
+    return fit(), "local"
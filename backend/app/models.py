@@ -16,6 +16,12 @@ class QuoteResponse(BaseModel):
     decision: Literal["auto_approve", "refer", "reject"]
     reasons: list[str] = []
 
+class QuoteBatchRequest(BaseModel):
+    quotes: list[QuoteRequest] = Field(max_length=10000)
+
+class QuoteBatchResponse(BaseModel):
+    results: list[QuoteResponse]
+
 class UnderwriteRequest(QuoteRequest):
     requested_coverage: float = Field(gt=0)
 
@@ -33,6 +39,19 @@ class ClaimResponse(BaseModel):
     summary: str
     complexity: Literal["low","medium","high"]
 
+class FraudClaim(BaseModel):
+    claim_id: str | None = None
+    amount: float
+
+class FraudBatchRequest(BaseModel):
+    claims: list[FraudClaim] = Field(max_length=100_000)
+
+class FraudScore(FraudClaim):
+    fraud_risk: float
+
+class FraudBatchResponse(BaseModel):
+    results: list[FraudScore]
+
 class ChatRequest(BaseModel):
     session_id: str
     message: str
@@ -65,6 +84,18 @@ class CustomerResponse(CustomerPayload):
     pass
 
 
+class ImportRowError(BaseModel):
+    line: int
+    error: str
+
+
+class CustomerBulkResponse(BaseModel):
+    processed: int
+    upserted: int
+    failed: int
+    errors: list[ImportRowError] = []
+
+
 class MarketingRequest(BaseModel):
     customer_id: str
     product: str
@@ -1,10 +1,96 @@
-from sqlalchemy import create_engine, Column, Integer, String, JSON, DateTime, Text
+from sqlalchemy import create_engine, event, Column, Index, Integer, String, JSON, DateTime, Text
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 from datetime import datetime
 from .config import settings
 
-engine = create_engine(settings.db_url, echo=False, future=True)
+
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def _sqlite_engine(url, factory=create_engine):
+    in_memory = url.database in (None, "", ":memory:")
+    connect_args = {"check_same_thread": False, "timeout": settings.sqlite_busy_timeout}
+    if in_memory:
+        # One shared connection, otherwise every pooled connection sees its own empty DB.
+        engine = factory(url, echo=False, connect_args=connect_args, poolclass=StaticPool)
+    else:
+        # aiosqlite defaults to NullPool, which reopens the file on every checkout.
+        pool_class = AsyncAdaptedQueuePool if factory is create_async_engine else QueuePool
+        engine = factory(
+            url,
+            echo=False,
+            connect_args=connect_args,
+            poolclass=pool_class,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+        )
+
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_pragmas(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        if settings.sqlite_wal and not in_memory:
+            # WAL lets readers proceed while a writer commits; NORMAL only fsyncs at checkpoints.
+            cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+        cur.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout * 1000)}")
+        cur.close()
+
+    return engine
+
+
+def create_db_engine(db_url: str | None = None) -> Engine:
+    url = make_url(db_url or settings.db_url)
+    if url.get_backend_name() == "sqlite":
+        return _sqlite_engine(url)
+    return create_engine(
+        url,
+        echo=False,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_recycle=settings.db_pool_recycle,
+    )
+
+
+def async_db_url(db_url: str | None = None) -> URL:
+    if settings.async_db_url and db_url is None:
+        return make_url(settings.async_db_url)
+    url = make_url(db_url or settings.db_url)
+    if url.get_dialect().is_async:
+        return url
+    return url.set(drivername=_ASYNC_DRIVERS[url.get_backend_name()])
+
+
+def create_async_db_engine(db_url: str | None = None) -> AsyncEngine:
+    url = async_db_url(db_url)
+    if url.get_backend_name() == "sqlite":
+        return _sqlite_engine(url, factory=create_async_engine)
+    return create_async_engine(
+        url,
+        echo=False,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_recycle=settings.db_pool_recycle,
+    )
+
+
+engine = create_db_engine()
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+async_engine = create_async_db_engine()
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 class Log(Base):
@@ -15,6 +101,8 @@ class Log(Base):
     action = Column(String(128))
     payload = Column(JSON)
 
+    __table_args__ = (Index("ix_logs_actor_action_ts", "actor", "action", "ts"),)
+
 class Customer(Base):
     __tablename__ = "customers"
     id = Column(Integer, primary_key=True)
@@ -25,3 +113,8 @@ class Customer(Base):
 
 def init_db():
     Base.metadata.create_all(bind=engine)
+    # create_all only builds indexes together with new tables; add ones
+    # introduced after a table already exists.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
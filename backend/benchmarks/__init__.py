@@ -0,0 +1,16 @@
+"""Offline micro-benchmarks. Run from ``backend/``: ``python -m benchmarks.<name>``."""
+
+import time
+from typing import Callable
+
+
+def per_call_us(fn: Callable[[], object], number: int = 2000, repeat: int = 5) -> float:
+    """Best-of-``repeat`` mean latency of ``fn`` in microseconds."""
+    fn()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1e6
@@ -0,0 +1,81 @@
+"""Concurrent /customers + /quote throughput with legacy vs tuned SQLite settings.
+
+Each profile runs in a fresh interpreter against its own temporary database so
+the engine is built from that profile's environment:
+
+    python -m benchmarks.db_load [--requests 2000] [--concurrency 32]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROFILES = {
+    # Rollback journal with FULL fsync, which is what a bare create_engine gives.
+    "before": {"SQLITE_WAL": "false", "SQLITE_SYNCHRONOUS": "FULL", "DB_POOL_SIZE": "5", "DB_MAX_OVERFLOW": "10"},
+    "after": {},
+}
+
+
+async def _drive(total: int, concurrency: int) -> dict:
+    import httpx
+
+    from app.main import app
+
+    quote = {"customer_id": "c1", "age": 30, "vehicle_value": 15000.0, "prior_claims": 0, "credit_score": 680}
+    counter = iter(range(total))
+    errors = 0
+
+    async def worker(client):
+        nonlocal errors
+        for i in counter:
+            if i % 2:
+                r = await client.post("/quote", json=quote)
+            else:
+                customer = {"customer_id": f"load-{i % 500}", "name": "Load Test", "email": "load@example.com"}
+                r = await client.post("/customers", json=customer)
+            errors += r.status_code != 200
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/quote", json=quote)  # build the orchestrator outside the timed window
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return {"requests": total, "errors": errors, "seconds": round(elapsed, 3), "rps": round(total / elapsed, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--profile", choices=PROFILES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.profile:
+        print(json.dumps(asyncio.run(_drive(args.requests, args.concurrency))))
+        return
+
+    for name, overrides in PROFILES.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {
+                **os.environ,
+                **overrides,
+                # Measure the database, not the write-behind log buffer.
+                "LOG_WRITE_BEHIND": "false",
+                "DB_URL": f"sqlite:///{Path(tmp) / 'load.sqlite3'}",
+            }
+            cmd = [sys.executable, "-m", "benchmarks.db_load", "--profile", name,
+                   "--requests", str(args.requests), "--concurrency", str(args.concurrency)]
+            out = subprocess.run(cmd, env=env, capture_output=True, text=True, check=True)
+            print(f"{name:<7} {out.stdout.strip().splitlines()[-1]}")
+
+
+if __name__ == "__main__":
+    main()
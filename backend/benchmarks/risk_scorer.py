@@ -0,0 +1,20 @@
+"""Per-call latency of single-quote risk scoring: sklearn pipeline vs compiled."""
+
+from app.agents.risk_model import CompiledRiskScorer, RiskModel
+
+from . import per_call_us
+
+PAYLOAD = {"age": 30, "vehicle_value": 15000.0, "prior_claims": 1, "credit_score": 680}
+
+
+def main():
+    model = RiskModel(RiskModel.fit())
+    compiled = CompiledRiskScorer(model.pipe)
+    pipeline_us = per_call_us(lambda: model.predict_proba(PAYLOAD))
+    compiled_us = per_call_us(lambda: compiled.predict_proba(PAYLOAD), number=50000)
+    print(f"pipeline  {pipeline_us:9.2f} us/call")
+    print(f"compiled  {compiled_us:9.2f} us/call  ({pipeline_us / compiled_us:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
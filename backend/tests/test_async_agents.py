@@ -0,0 +1,29 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+
+from app.agents.customer360 import AsyncCustomer360Agent
+from app.agents.observability import AsyncObservabilityAgent
+from app.storage import async_engine, init_db
+
+
+def test_async_customer_lookups_run_concurrently():
+    init_db()
+
+    async def scenario():
+        c360 = AsyncCustomer360Agent()
+        await c360.upsert("async-1", "Robin Park", "robin@example.com")
+        await c360.upsert("async-1", "Robin Park", "robin.park@example.com")
+        records = await asyncio.gather(*(c360.get("async-1") for _ in range(500)))
+        obs = AsyncObservabilityAgent()
+        await obs.log("test", "async_log", {"n": len(records)})
+        logs = await obs.list(limit=1)
+        await async_engine.dispose()
+        return records, logs
+
+    records, logs = asyncio.run(scenario())
+    assert {r["email"] for r in records} == {"robin.park@example.com"}
+    assert logs[0]["action"] == "async_log"
@@ -0,0 +1,44 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app.main import app, get_orchestrator, get_obs
+
+client = TestClient(app)
+
+
+def _portfolio(n: int) -> list[dict]:
+    rng = np.random.default_rng(7)
+    return [
+        {
+            "customer_id": f"c{i}",
+            "age": int(rng.integers(16, 101)),
+            "vehicle_value": float(round(rng.uniform(1000, 120000), 2)),
+            "prior_claims": int(rng.integers(0, 11)),
+            "credit_score": int(rng.integers(300, 851)),
+            "gender": ["M", "F", "X", None][i % 4],
+        }
+        for i in range(n)
+    ]
+
+
+def test_quote_many_matches_single_quote_path():
+    orch = get_orchestrator(get_obs())
+    portfolio = _portfolio(100)
+    assert orch.quote_many(portfolio) == [orch.quote(p) for p in portfolio]
+
+
+def test_quote_batch_endpoint():
+    portfolio = _portfolio(5)
+    r = client.post("/quote/batch", json={"quotes": portfolio})
+    assert r.status_code == 200
+    results = r.json()["results"]
+    assert len(results) == 5
+    assert results[0] == client.post("/quote", json=portfolio[0]).json()
+
+    r = client.post("/quote/batch", json={"quotes": [{**portfolio[0], "age": 5}]})
+    assert r.status_code == 422
@@ -0,0 +1,37 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from fastapi.testclient import TestClient
+
+from app.agents import customer360
+from app.agents.customer360 import Customer360Agent
+from app.cache import MemoryCacheBackend, ReadThroughCache
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_profile_reads_are_cached_and_writes_go_through(monkeypatch):
+    backend = MemoryCacheBackend()
+    cache = ReadThroughCache("customer", max_entries=100, ttl=60, backend=backend)
+    monkeypatch.setattr(customer360, "_profile_cache", cache)
+
+    c360 = Customer360Agent()
+    c360.upsert("cache-1", "Kim", "kim@example.com")
+    assert backend.get("customer:cache-1")["email"] == "kim@example.com"
+    for _ in range(3):
+        client.post("/marketing/outreach", json={"customer_id": "cache-1", "product": "Auto"})
+    assert client.get("/customers/cache-1").json()["name"] == "Kim"
+
+    # Another worker that only shares the backend is served without the DB.
+    cache.local.clear()
+    assert c360.get("cache-1")["name"] == "Kim"
+
+    c360.upsert_many([{"customer_id": "cache-1", "name": "Kim Lee", "email": "kim@example.com", "phone": None}])
+    assert backend.get("customer:cache-1") is None
+    assert client.get("/customers/cache-1").json()["name"] == "Kim Lee"
+
+    stats = client.get("/stats").json()["customer_cache"]
+    assert (stats["local_hits"], stats["shared_hits"], stats["misses"]) == (4, 1, 1)
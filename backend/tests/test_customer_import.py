@@ -0,0 +1,52 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import json
+
+from fastapi.testclient import TestClient
+
+from app.agents.customer360 import Customer360Agent
+from app.cli import main as cli_main
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_upsert_is_single_statement_returning_stored_row():
+    c360 = Customer360Agent()
+    c360.upsert("upsert-1", "Sam Lee", "sam@example.com")
+    stored = c360.upsert("upsert-1", "Sam Lee", "sam.lee@example.com", "+1")
+    assert stored == {"customer_id": "upsert-1", "name": "Sam Lee", "email": "sam.lee@example.com", "phone": "+1"}
+
+
+def test_bulk_ndjson_and_csv_import():
+    lines = [
+        {"customer_id": "bulk-1", "name": "Ana", "email": "ANA@example.com"},
+        {"customer_id": "bulk-2", "name": "Ben", "email": "not-an-email"},
+        {"customer_id": "bulk-1", "name": "Ana Maria", "email": "ana@example.com"},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines) + "\n{broken\n"
+    r = client.post("/customers/bulk", content=body, headers={"content-type": "application/x-ndjson"})
+    assert r.status_code == 200
+    summary = r.json()
+    assert (summary["processed"], summary["upserted"], summary["failed"]) == (4, 1, 2)
+    assert [e["line"] for e in summary["errors"]] == [2, 4]
+    assert client.get("/customers/bulk-1").json()["name"] == "Ana Maria"
+
+    csv_body = "customer_id,name,email,phone\nbulk-3,\"Cruz, Dana\",dana@example.com,\n"
+    r = client.post("/customers/bulk", content=csv_body, headers={"content-type": "text/csv"})
+    assert r.json()["upserted"] == 1
+    assert client.get("/customers/bulk-3").json()["name"] == "Cruz, Dana"
+
+    r = client.post("/customers/bulk", content="x", headers={"content-type": "text/plain"})
+    assert r.status_code == 415
+
+
+def test_cli_import(tmp_path, capsys):
+    path = tmp_path / "crm.csv"
+    path.write_text("customer_id,name,email\ncli-1,Eve,eve@example.com\ncli-2,Finn,finn@example.com\n")
+    cli_main(["customers", "import", str(path), "--chunk-size", "1"])
+    assert json.loads(capsys.readouterr().out)["upserted"] == 2
+    assert Customer360Agent().get("cli-2")["name"] == "Finn"
@@ -0,0 +1,36 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import json
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app.agents.fraud import FraudAgent
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_score_claims_matches_single_scoring():
+    agent = FraudAgent()
+    amounts = np.random.default_rng(3).uniform(0, 30000, 300).round(2).tolist()
+    assert agent.score_claims(amounts) == [agent.score_claim(a) for a in amounts]
+
+
+def test_batch_and_stream_endpoints():
+    claims = [{"claim_id": "a", "amount": 2900.0}, {"claim_id": "b", "amount": 19000.0}]
+    r = client.post("/fraud/score/batch", json={"claims": claims})
+    assert r.status_code == 200
+    results = r.json()["results"]
+    single = client.get("/fraud/score", params={"amount": 19000.0}).json()["fraud_risk"]
+    assert [x["claim_id"] for x in results] == ["a", "b"]
+    assert results[1]["fraud_risk"] == single
+
+    body = "\n".join(json.dumps(c) for c in claims) + '\n{"claim_id": "c"}\n'
+    r = client.post("/fraud/score/batch/stream", content=body, headers={"content-type": "application/x-ndjson"})
+    lines = [json.loads(line) for line in r.text.splitlines()]
+    assert [line.get("fraud_risk") for line in lines[:2]] == [x["fraud_risk"] for x in results]
+    assert lines[2] == {"line": 3, "error": "Field required"}
@@ -0,0 +1,35 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert, select
+
+from app.log_archive import LogArchive
+from app.storage import Log, engine, init_db
+
+
+def test_compact_moves_closed_days_to_parquet_and_query_reads_both(tmp_path):
+    init_db()
+    actor = f"archive-{uuid.uuid4().hex[:8]}"
+    now = datetime.utcnow()
+    old = [now - timedelta(days=3), now - timedelta(days=3, minutes=1), now - timedelta(days=40)]
+    with engine.begin() as conn:
+        conn.execute(insert(Log), [{"ts": ts, "actor": actor, "action": "old", "payload": {"n": i}} for i, ts in enumerate(old)])
+        conn.execute(insert(Log), [{"ts": now, "actor": actor, "action": "live", "payload": {"n": 3}}])
+
+    archive = LogArchive(tmp_path, retention_days=30)
+    days = {s["day"] for s in archive.compact()}
+    assert {ts.date().isoformat() for ts in old} <= days
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).where(Log.actor == actor)).scalar() == 1
+
+    rows = archive.query(actor=actor)
+    assert [r["payload"]["n"] for r in rows] == [3, 1, 0, 2]
+    assert [r["action"] for r in archive.query(actor=actor, since=now - timedelta(days=5), limit=2)] == ["live", "old"]
+
+    assert (now - timedelta(days=40)).date().isoformat() in archive.prune()
+    assert [r["payload"]["n"] for r in archive.query(actor=actor)] == [3, 1, 0]
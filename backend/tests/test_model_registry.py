@@ -0,0 +1,37 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from app.agents.fraud import FraudAgent
+from app.agents.risk_model import RiskModel
+from app.cli import main as cli_main
+from app.config import settings
+from app.model_registry import ModelRegistry
+
+
+def test_publish_and_load_round_trip(tmp_path, monkeypatch):
+    cli_main(["models", "publish", "all", "--registry", str(tmp_path)])
+    cli_main(["models", "publish", "risk_model", "--registry", str(tmp_path)])
+    registry = ModelRegistry(tmp_path)
+    assert registry.current("risk_model") == "v2"
+    assert [m["version"] for m in registry.versions("fraud")] == ["v1"]
+
+    monkeypatch.setattr(settings, "registry_dir", str(tmp_path))
+    risk, fraud = RiskModel(), FraudAgent()
+    assert (risk.version, fraud.version) == ("v2", "v1")
+
+    payload = {"age": 30, "vehicle_value": 15000.0, "prior_claims": 1, "credit_score": 640}
+    assert risk.predict_proba(payload) == RiskModel(RiskModel.fit()).predict_proba(payload)
+    assert fraud.score_claim(9000) == FraudAgent(FraudAgent.fit()).score_claim(9000)
+
+
+def test_load_rejects_tampered_artifact(tmp_path):
+    registry = ModelRegistry(tmp_path)
+    registry.publish("risk_model", RiskModel.fit())
+    with (tmp_path / "risk_model" / "v1" / "model.joblib").open("ab") as f:
+        f.write(b"\0")
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        registry.load("risk_model")
@@ -0,0 +1,59 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import json
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.agents.observability import LogWriter, ObservabilityAgent
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_log_is_buffered_and_visible_after_flush():
+    obs = ObservabilityAgent()
+    before = obs.stats()["enqueued"]
+    obs.log("test", "write_behind", {"n": 1})
+    assert obs.stats()["enqueued"] == before + 1
+
+    rows = client.get("/logs", params={"limit": 5}).json()
+    assert any(r["action"] == "write_behind" for r in rows)
+    stats = client.get("/logs/stats").json()
+    assert stats["queued"] == 0
+    assert stats["written"] >= 1
+
+
+def test_full_buffer_drops_and_counts():
+    writer = LogWriter(max_size=1, batch_size=100, flush_interval=60, put_timeout=0)
+    row = {"actor": "test", "action": "backpressure", "payload": {}}
+    assert [writer.submit(row) for _ in range(3)] == [True, False, False]
+    assert writer.stats()["dropped"] == 2
+    writer.close()
+    stats = writer.stats()
+    assert (stats["queued"], stats["written"], stats["dropped"]) == (0, 1, 2)
+
+
+def test_logs_keyset_pages_filters_and_export():
+    obs = ObservabilityAgent()
+    actor = f"pager-{uuid.uuid4().hex[:8]}"
+    for i in range(5):
+        obs.log(actor, "page_test" if i % 2 else "other", {"i": i})
+
+    r = client.get("/logs", params={"actor": actor, "limit": 2})
+    first = r.json()
+    assert [row["payload"]["i"] for row in first] == [4, 3]
+    r = client.get("/logs", params={"actor": actor, "limit": 2, "cursor": r.headers["X-Next-Cursor"]})
+    assert [row["payload"]["i"] for row in r.json()] == [2, 1]
+
+    r = client.get("/logs", params={"actor": actor, "action": "page_test"})
+    assert [row["payload"]["i"] for row in r.json()] == [3, 1]
+    assert "X-Next-Cursor" not in r.headers
+
+    r = client.get("/logs/export", params={"actor": actor, "since": first[-1]["ts"]})
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    exported = [json.loads(line) for line in r.text.splitlines()]
+    assert [row["payload"]["i"] for row in exported][-2:] == [3, 4]
@@ -0,0 +1,48 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.agents.observability import ObservabilityAgent
+from app.agents.orchestrator import DecisionOrchestrator
+from app.cache import TTLCache
+from app.config import settings
+
+PAYLOAD = {
+    "customer_id": "c-cache",
+    "age": 30,
+    "vehicle_value": 15000.0,
+    "prior_claims": 0,
+    "credit_score": 680,
+    "gender": "F",
+}
+
+
+def test_ttl_cache_evicts_lru_and_expires():
+    now = [0.0]
+    cache = TTLCache(max_entries=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    now[0] = 11
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["expirations"]) == (1, 2, 1, 1)
+
+
+def test_repeated_quote_is_served_from_cache(monkeypatch):
+    monkeypatch.setattr(settings, "quote_cache_enabled", True)
+    obs = ObservabilityAgent()
+    orch = DecisionOrchestrator(obs)
+    first = orch.quote(dict(PAYLOAD))
+    second = orch.quote(dict(PAYLOAD))
+    assert first == second
+    assert orch.cache.stats()["hits"] == 1
+    assert obs.list(limit=1)[0]["action"] == "quote_cache_hit"
+
+    orch.risk.version = "v-next"
+    orch.quote(dict(PAYLOAD))
+    assert orch.cache.stats()["hits"] == 1
+    assert len(orch.cache) == 1
@@ -0,0 +1,39 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+
+from app.agents.risk_model import FEATURES, CompiledRiskScorer, RiskModel
+
+
+def test_compiled_scorer_matches_pipeline_over_input_domain():
+    pipe = RiskModel.fit()
+    scorer = CompiledRiskScorer(pipe)
+    # Every age / prior_claims value QuoteRequest accepts, credit scores in steps
+    # of 10 and vehicle values spanning 1 to 1M on a log scale.
+    grid = np.array(
+        np.meshgrid(
+            np.arange(16, 101),
+            np.geomspace(1, 1_000_000, 12).round(2),
+            np.arange(0, 11),
+            np.arange(300, 851, 10),
+        )
+    ).reshape(4, -1).T
+    expected = pipe.predict_proba(grid)[:, 1]
+    rows = [dict(zip(FEATURES, row)) for row in grid.tolist()]
+    raw = np.array([scorer.raw_proba(r) for r in rows])
+    assert np.max(np.abs(raw - expected)) < 1e-12
+    assert [scorer.predict_proba(r) for r in rows] == [round(p, 4) for p in expected.tolist()]
+
+
+def test_compiled_mode_is_used_when_configured(monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "risk_scoring_mode", "compiled")
+    model = RiskModel(RiskModel.fit())
+    payload = {"age": 30, "vehicle_value": 15000.0, "prior_claims": 0, "credit_score": 680}
+    assert isinstance(model.compiled, CompiledRiskScorer)
+    X = np.array([[payload[f] for f in FEATURES]], dtype=float)
+    assert model.predict_proba(payload) == round(model.pipe.predict_proba(X)[0, 1].item(), 4)
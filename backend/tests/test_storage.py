@@ -0,0 +1,26 @@
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from app.storage import create_db_engine
+
+
+def test_sqlite_file_engine_uses_wal_and_sized_pool(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'wal.sqlite3'}")
+    assert isinstance(engine.pool, QueuePool)
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+
+
+def test_sqlite_memory_engine_shares_one_connection():
+    engine = create_db_engine("sqlite:///:memory:")
+    assert isinstance(engine.pool, StaticPool)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE t (x INTEGER)")
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT count(*) FROM t").scalar() == 0